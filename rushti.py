@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import asyncio
 import configparser
 import csv
@@ -5,7 +7,7 @@ import functools
 import itertools
 import logging
 import os
-import shlex
+import re
 import sys
 import uuid
 from base64 import b64decode
@@ -14,7 +16,7 @@ from datetime import datetime, timedelta
 from itertools import product
 from logging.config import fileConfig
 from pathlib import Path
-from typing import List, Union, Dict, Tuple, Type, Any
+from typing import List, Union, Dict, Tuple, Type, Any, TYPE_CHECKING
 
 import keyring
 
@@ -23,7 +25,9 @@ try:
 except ImportError:
     pass
 
-from TM1py import TM1Service
+# TM1py is slow to import. Load it only when connecting (see setup_tm1_services)
+if TYPE_CHECKING:
+    from TM1py import TM1Service
 
 from utils import set_current_directory, Task, OptimizedTask, ExecutionMode, Wait, flatten_to_list
 
@@ -73,7 +77,17 @@ MSG_PROCESS_PARAMS_INCORRECT = (
 # used to wrap blackslashes before using
 UNIQUE_STRING = uuid.uuid4().hex[:8].upper()
 
-TRUE_VALUES = ["1", "y", "yes", "true", "t"]
+TRUE_VALUES = frozenset(["1", "y", "yes", "true", "t"])
+# arguments of a task line with a special meaning
+RESERVED_ARGUMENTS = frozenset(["process", "instance", "id"])
+BOOLEAN_ARGUMENTS = frozenset(["require_predecessor_success", "succeed_on_minor_errors"])
+
+# tokenize task lines with POSIX shell rules (same result as shlex.split(line, posix=True))
+LINE_SEPARATOR_PATTERN = re.compile(r"[ \t\r\n]*")
+LINE_WORD_PATTERN = re.compile(r"""(?:[^ \t\r\n"'\\]+|\\.|"(?:[^"\\]|\\.)*"|'[^']*')+""", re.DOTALL)
+WORD_PART_PATTERN = re.compile(r""""((?:[^"\\]|\\.)*)"|'([^']*)'|\\(.)|([^"'\\]+)""", re.DOTALL)
+# inside double quotes only \" and \\ are escape sequences
+DOUBLE_QUOTED_ESCAPE_PATTERN = re.compile(r'\\(["\\])')
 
 if not os.path.isfile(LOGGING_CONFIG):
     raise ValueError("{config} does not exist".format(config=LOGGING_CONFIG))
@@ -92,6 +106,8 @@ def setup_tm1_services(max_workers: int, tasks_file_path: str, execution_mode: E
     if not os.path.isfile(CONFIG):
         raise ValueError("{config} does not exist".format(config=CONFIG))
 
+    from TM1py import TM1Service
+
     tm1_instances_in_tasks = get_instances_from_tasks_file(execution_mode, max_workers, tasks_file_path)
     tm1_preserve_connections = dict()
     tm1_services = dict()
@@ -205,12 +221,45 @@ def extract_task_from_line(line: str, task_class: Union[Type[Task], Type[Optimiz
             process_name=line_arguments.pop("process"),
             parameters=line_arguments)
 
+def unquote_word_part(match) -> str:
+    double_quoted, single_quoted, escaped, plain = match.groups()
+    if double_quoted is not None:
+        return DOUBLE_QUOTED_ESCAPE_PATTERN.sub(r"\1", double_quoted)
+    if single_quoted is not None:
+        return single_quoted
+    if escaped is not None:
+        return escaped
+    return plain
+
+
+def split_line(line: str) -> List[str]:
+    """ Split a line into words, honoring quotes and backslash escapes like shlex.split(line, posix=True)
+
+    :param line: line from tasks file
+    :return: list of unquoted words
+    """
+    words = []
+    position = LINE_SEPARATOR_PATTERN.match(line).end()
+    while position < len(line):
+        match = LINE_WORD_PATTERN.match(line, position)
+        if not match:
+            raise ValueError("No closing quotation" if line[position] in "\"'" else "No escaped character")
+
+        word = match.group()
+        if '"' in word or "'" in word or "\\" in word:
+            word = WORD_PART_PATTERN.sub(unquote_word_part, word)
+        words.append(word)
+        position = LINE_SEPARATOR_PATTERN.match(line, match.end()).end()
+
+    return words
+
+
 def parse_line_arguments(line: str) -> Dict[str, Any]:
     line_arguments = {}
-    
-    # Use shlex to split the line with posix=True for proper escaping
-    parts = shlex.split(line, posix=True)
-    
+
+    # split the line with posix shell rules for proper escaping
+    parts = split_line(line)
+
     for part in parts:
         if '=' not in part:
             continue
@@ -220,15 +269,13 @@ def parse_line_arguments(line: str) -> Dict[str, Any]:
         
         # Handle specific keys with logic
         key_lower = argument.lower()
-        if key_lower in ["process", "instance", "id"]:
+        if key_lower in RESERVED_ARGUMENTS:
             line_arguments[key_lower] = value
-        elif key_lower == "require_predecessor_success":
+        elif key_lower in BOOLEAN_ARGUMENTS:
             line_arguments[argument] = value.lower() in TRUE_VALUES
         elif key_lower == "predecessors":
             predecessors = value.split(",")
-            line_arguments[argument] = [] if predecessors[0] in ["", "0", 0] else predecessors
-        elif key_lower == "succeed_on_minor_errors":
-            line_arguments[argument] = value.lower() in TRUE_VALUES
+            line_arguments[argument] = [] if predecessors[0] in ("", "0") else predecessors
         else:
             # Directly assign the value without stripping quotes
             line_arguments[argument] = value
@@ -271,7 +318,7 @@ def extract_ordered_tasks_and_waits_from_file_type_norm(
         expand: bool = False,
         tm1_services: Dict[str, TM1Service] = None):
     with open(file_path, encoding='utf-8') as file:
-        original_tasks = [extract_task_or_wait_from_line(line) for line in file.readlines() if not line.startswith('#')]
+        original_tasks = [extract_task_or_wait_from_line(line) for line in file if not line.startswith('#')]
         if not expand:
             return original_tasks
 
@@ -315,9 +362,8 @@ def extract_tasks_from_file_type_opt(
     # Mapping of id against task
     tasks = dict()
     with open(file_path, encoding='utf-8') as input_file:
-        lines = input_file.readlines()
-        # Build tasks dictionary
-        for line in lines:
+        # Build tasks dictionary. Stream lines instead of reading the whole file into memory
+        for line in input_file:
             # exclude comments
             if not line.startswith('#'):
                 # skip empty lines
@@ -343,7 +389,7 @@ def extract_tasks_from_file_type_opt(
             predecessors = task.predecessors
             for predecessor_id in predecessors:
                 for pre_task in tasks[predecessor_id]:
-                    pre_task.successors.append(task.id)
+                    pre_task.successors[task.id] = None
     return tasks
 
 
@@ -616,42 +662,49 @@ def verify_predecessors_ok(task: OptimizedTask) -> bool:
 
 
 def validate_tasks(tasks: List[Task], tm1_services: Dict[str, TM1Service]) -> bool:
-    validated_tasks = []
+    validated_tasks = set()
+    # query TM1 once per instance and process, no matter how many tasks run it
+    process_exists = dict()
+    process_parameters = dict()
     validation_ok = True
 
     tasks = [task for task in tasks if isinstance(task, Task)]  # --> ignore Wait(s)
     for task in tasks:
-        current_task = {
-            'instance': task.instance_name,
-            'process': task.process_name,
-            'parameters': task.parameters.keys()
-        }
+        current_task = (task.instance_name, task.process_name, frozenset(task.parameters))
 
         tm1 = tm1_services[task.instance_name]
 
         # avoid repeated validations
-        if current_task["process"] in validated_tasks:
+        if current_task in validated_tasks:
             continue
+        validated_tasks.add(current_task)
 
         # check for process existence
-        if not tm1.processes.exists(task.process_name):
-            msg = MSG_PROCESS_NOT_EXISTS.format(
-                process=task.process_name,
-                instance=task.instance_name
-            )
-            logger.error(msg)
-            validated_tasks.append(current_task["process"])
+        process = (task.instance_name, task.process_name)
+        if process not in process_exists:
+            process_exists[process] = tm1.processes.exists(task.process_name)
+            if not process_exists[process]:
+                msg = MSG_PROCESS_NOT_EXISTS.format(
+                    process=task.process_name,
+                    instance=task.instance_name
+                )
+                logger.error(msg)
+
+        if not process_exists[process]:
             validation_ok = False
             continue
 
         # check for parameters
         task_params = task.parameters.keys()
         if task_params:
-            process_params = [param['Name'] for param in tm1.processes.get(task.process_name).parameters]
+            if process not in process_parameters:
+                process_parameters[process] = frozenset(
+                    param['Name'] for param in tm1.processes.get(task.process_name).parameters)
+            process_params = process_parameters[process]
 
             # check for missing parameter names
             missing_params = [param for param in task_params if param not in process_params]
-            if len(missing_params) > 0:
+            if missing_params:
                 msg = MSG_PROCESS_PARAMS_INCORRECT.format(
                     process=task.process_name,
                     parameters=missing_params,
@@ -660,8 +713,6 @@ def validate_tasks(tasks: List[Task], tm1_services: Dict[str, TM1Service]) -> bo
                 logger.error(msg)
                 validation_ok = False
 
-        validated_tasks.append(current_task)
-
     return validation_ok
 
 
@@ -1,8 +1,9 @@
 import unittest
+from unittest.mock import Mock
 
 from rushti import deduce_levels_of_tasks, extract_tasks_from_file_type_opt, \
-    extract_ordered_tasks_and_waits_from_file_type_opt, parse_line_arguments
-from utils import OptimizedTask, Wait
+    extract_ordered_tasks_and_waits_from_file_type_opt, parse_line_arguments, validate_tasks
+from utils import Task, OptimizedTask, Wait, ExecutionMode, flatten_to_list
 
 
 class TestDataMethods(unittest.TestCase):
@@ -78,6 +79,12 @@ class TestDataMethods(unittest.TestCase):
         outcome = deduce_levels_of_tasks(tasks)
         self.assertEqual(expected_outcome, outcome)
 
+    def test_successors_are_unique(self):
+        tasks = extract_tasks_from_file_type_opt(r"tests/resources/tasks_opt_multi_task_per_id.txt")
+        self.assertEqual(['2'], list(tasks['1'][0].successors))
+        self.assertEqual(['3'], list(tasks['2'][0].successors))
+        self.assertEqual(['3'], list(tasks['2'][1].successors))
+
     def test_extract_lines_from_file_type_opt_happy_case(self):
         ordered_tasks = extract_ordered_tasks_and_waits_from_file_type_opt(
             5,
@@ -203,6 +210,22 @@ class TestParseLineArguments(unittest.TestCase):
         }
         self.assertEqual(result, expected)
 
+    def test_single_quotes_and_unquoted_escapes(self):
+        line = "instance=tm1 process=process1 param1='single \\ quoted' param2=escaped\\ space"
+        result = parse_line_arguments(line)
+        expected = {
+            'instance': 'tm1',
+            'process': 'process1',
+            'param1': 'single \\ quoted',
+            'param2': 'escaped space'
+        }
+        self.assertEqual(result, expected)
+
+    def test_unclosed_quotation(self):
+        line = 'instance=tm1 process=process1 param1="value'
+        with self.assertRaises(ValueError):
+            parse_line_arguments(line)
+
 
 class TestSucceedOnMinorErrors(unittest.TestCase):
     def test_default_value(self):
@@ -243,6 +266,11 @@ class TestSucceedOnMinorErrors(unittest.TestCase):
         }
         self.assertEqual(result, expected)
 
+    def test_task_line_translation(self):
+        task = Task("tm1srv01", "process1", {"param1": "value1", "param2": "value 2"}, succeed_on_minor_errors=True)
+        expected_line = 'instance="tm1srv01" process="process1" succeed_on_minor_errors="True" param1="value1" param2="value 2"\n'
+        self.assertEqual(task.translate_to_line(), expected_line)
+
     def test_line_translation_with_succeed_on_minor_errors(self):
         task = OptimizedTask("1", "tm1srv01", "process1", {"param1": "value1"}, [], False, succeed_on_minor_errors=True)
         expected_line = 'id="1" predecessors="" require_predecessor_success="False" succeed_on_minor_errors="True" instance="tm1srv01" process="process1" param1="value1"\n'
@@ -254,5 +282,99 @@ class TestSucceedOnMinorErrors(unittest.TestCase):
         self.assertEqual(task.translate_to_line(), expected_line)
 
 
+class TestTask(unittest.TestCase):
+
+    def test_non_string_names(self):
+        task = Task(None, None, {})
+        self.assertIsNone(task.instance_name)
+        self.assertIsNone(task.process_name)
+
+    def test_optimized_task_keeps_given_id(self):
+        before = Task("tm1srv01", "process1", {}).id
+        task = OptimizedTask("7", "tm1srv01", "process1", {}, [], False)
+        after = Task("tm1srv01", "process1", {}).id
+        self.assertEqual("7", task.id)
+        self.assertEqual(before + 1, after)
+
+
+class TestExecutionMode(unittest.TestCase):
+
+    def test_lookup_by_name(self):
+        self.assertIs(ExecutionMode.OPT, ExecutionMode("opt"))
+        self.assertIs(ExecutionMode.OPT, ExecutionMode("OPT"))
+        self.assertIs(ExecutionMode.NORM, ExecutionMode("Norm"))
+        self.assertIs(ExecutionMode.OPT, ExecutionMode(2))
+
+    def test_default_value(self):
+        self.assertIs(ExecutionMode.NORM, ExecutionMode("unknown"))
+
+    def test_invalid_value(self):
+        with self.assertRaises(ValueError):
+            ExecutionMode(5)
+        with self.assertRaises(ValueError):
+            ExecutionMode(None)
+
+
+class TestWait(unittest.TestCase):
+
+    def test_equality_and_hash(self):
+        self.assertEqual(Wait(), Wait())
+        self.assertNotEqual(Wait(), Task("tm1srv01", "process1", {}))
+        self.assertEqual(1, len({Wait(), Wait()}))
+
+
+class TestFlattenToList(unittest.TestCase):
+
+    def test_nested_iterables(self):
+        nested = [1, [2, (3, [4, "five"])], [], "six", [[7]]]
+        self.assertEqual([1, 2, 3, 4, "five", "six", 7], flatten_to_list(nested))
+
+    def test_string(self):
+        self.assertEqual(["tasks"], flatten_to_list("tasks"))
+
+    def test_deep_nesting(self):
+        nested = [0]
+        for i in range(1, 5000):
+            nested = [nested, i]
+        self.assertEqual(list(range(5000)), flatten_to_list(nested))
+
+
+class TestValidateTasks(unittest.TestCase):
+
+    def test_process_queried_once_per_instance(self):
+        tm1 = Mock()
+        tm1.processes.exists.return_value = True
+        tm1.processes.get.return_value.parameters = [{'Name': 'pWaitSec'}]
+        tasks = [
+            Task("tm1srv01", "}bedrock.server.wait", {"pWaitSec": "1"}),
+            Wait(),
+            Task("tm1srv01", "}bedrock.server.wait", {"pWaitSec": "2"}),
+            Task("tm1srv01", "}bedrock.server.wait", {"pWaitSec": "3"})]
+
+        self.assertTrue(validate_tasks(tasks, {"tm1srv01": tm1}))
+        tm1.processes.exists.assert_called_once_with("}bedrock.server.wait")
+        tm1.processes.get.assert_called_once_with("}bedrock.server.wait")
+
+    def test_invalid_tasks(self):
+        tm1 = Mock()
+        tm1.processes.exists.side_effect = lambda process_name: process_name == "}bedrock.server.wait"
+        tm1.processes.get.return_value.parameters = [{'Name': 'pWaitSec'}]
+        tasks = [
+            Task("tm1srv01", "}bedrock.server.wait", {"pWaitSec": "1"}),
+            Task("tm1srv01", "}bedrock.server.wait", {"pWrong": "1"})]
+        with self.assertLogs(level='ERROR') as cm:
+            self.assertFalse(validate_tasks(tasks, {"tm1srv01": tm1}))
+        self.assertEqual(1, len(cm.output))
+        self.assertIn("does not have: ['pWrong']", cm.output[0])
+
+        tasks = [
+            Task("tm1srv01", "}bedrock.server.wait", {"pWaitSec": "1"}),
+            Task("tm1srv01", "}bedrock.missing", {})]
+        with self.assertLogs(level='ERROR') as cm:
+            self.assertFalse(validate_tasks(tasks, {"tm1srv01": tm1}))
+        self.assertEqual(1, len(cm.output))
+        self.assertIn("'}bedrock.missing' does not exist", cm.output[0])
+
+
 if __name__ == '__main__':
     unittest.main()
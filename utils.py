@@ -1,83 +1,92 @@
+import functools
 import os
 import sys
 from enum import Enum
-from typing import List, Dict, Any
+from itertools import count, repeat
+from typing import List, Dict, Any, Optional, Union
 
 
-def set_current_directory():
+@functools.lru_cache(maxsize=None)
+def get_application_directory() -> str:
     # determine if application is a script file or frozen exe
-    if getattr(sys, 'frozen', False):
-        application_path = os.path.abspath(sys.executable)
-    elif __file__:
-        application_path = os.path.abspath(__file__)
+    application_path = sys.executable if getattr(sys, 'frozen', False) else __file__
+    return os.path.dirname(os.path.abspath(application_path))
+
 
-    directory = os.path.dirname(application_path)
+def set_current_directory():
+    directory = get_application_directory()
     # set current directory
     os.chdir(directory)
     return directory
 
 
 class Wait:
+    __slots__ = ()
+
     def __init__(self):
         pass
 
     # useful for testing
     def __eq__(self, other):
-        if isinstance(other, Wait):
-            return True
+        return isinstance(other, Wait)
 
-        return False
+    # all Waits are equal, so they must share one hash
+    def __hash__(self):
+        return hash(Wait)
 
 
-class Task:
-    id = 1
+# allocates ids 1, 2, 3, ... to tasks. Atomic, unlike a read-modify-write of a class attribute
+next_task_id = count(1).__next__
+
 
-    def __init__(self, instance_name: str, process_name: str, parameters: Dict[str, Any] = None, succeed_on_minor_errors: bool = False):
-        self.id = Task.id
-        self.instance_name = instance_name
-        self.process_name = process_name
+class Task:
+    __slots__ = ("id", "instance_name", "process_name", "parameters", "succeed_on_minor_errors")
+
+    def __init__(self, instance_name: str, process_name: str, parameters: Dict[str, Any] = None, succeed_on_minor_errors: bool = False,
+                 task_id: Optional[Union[int, str]] = None):
+        # allocate a running id only if no id is given
+        self.id = next_task_id() if task_id is None else task_id
+        # few distinct names repeat across many tasks. Interning shares one copy and speeds up comparisons
+        self.instance_name = sys.intern(instance_name) if isinstance(instance_name, str) else instance_name
+        self.process_name = sys.intern(process_name) if isinstance(process_name, str) else process_name
         self.parameters = parameters
         self.succeed_on_minor_errors = succeed_on_minor_errors
 
-        Task.id = Task.id + 1
-
     def translate_to_line(self):
-        return 'instance="{instance}" process="{process}" succeed_on_minor_errors="{succeed_on_minor_errors}" {parameters}\n'.format(
-            instance=self.instance_name,
-            process=self.process_name,
-            succeed_on_minor_errors=self.succeed_on_minor_errors,
-            parameters=' '.join('{}="{}"'.format(parameter, value) for parameter, value in self.parameters.items()))
+        parameters = ' '.join([f'{parameter}="{value}"' for parameter, value in self.parameters.items()])
+        return (f'instance="{self.instance_name}" process="{self.process_name}" '
+                f'succeed_on_minor_errors="{self.succeed_on_minor_errors}" {parameters}\n')
 
 
 class OptimizedTask(Task):
+    __slots__ = ("predecessors", "require_predecessor_success", "successors")
+
     def __init__(self, task_id: str, instance_name: str, process_name: str, parameters: Dict[str, Any],
                  predecessors: List,
                  require_predecessor_success: bool,
                  succeed_on_minor_errors: bool = False):
-        super().__init__(instance_name, process_name, parameters, succeed_on_minor_errors)
-        self.id = task_id
+        super().__init__(instance_name, process_name, parameters, succeed_on_minor_errors, task_id=task_id)
         self.predecessors = predecessors
         self.require_predecessor_success = require_predecessor_success
-        self.successors = list()
+        # ordered set of successor ids (dict keys). Keeps insertion order for a deterministic scheduling
+        self.successors = {}
 
     @property
     def has_predecessors(self):
-        return len(self.predecessors) > 0
+        return bool(self.predecessors)
 
     @property
     def has_successors(self):
-        return len(self.successors) > 0
+        return bool(self.successors)
 
     
     def translate_to_line(self):
-        return 'id="{id}" predecessors="{predecessors}" require_predecessor_success="{require_predecessor_success}" succeed_on_minor_errors="{succeed_on_minor_errors}" instance="{instance}" process="{process}" {parameters}\n'.format(
-            id=self.id,
-            predecessors=",".join(map(str, self.predecessors)),
-            require_predecessor_success=self.require_predecessor_success,
-            succeed_on_minor_errors=self.succeed_on_minor_errors,
-            instance=self.instance_name,
-            process=self.process_name,
-            parameters=' '.join('{}="{}"'.format(parameter, value) for parameter, value in self.parameters.items()))
+        predecessors = ",".join(map(str, self.predecessors))
+        parameters = ' '.join([f'{parameter}="{value}"' for parameter, value in self.parameters.items()])
+        return (f'id="{self.id}" predecessors="{predecessors}" '
+                f'require_predecessor_success="{self.require_predecessor_success}" '
+                f'succeed_on_minor_errors="{self.succeed_on_minor_errors}" '
+                f'instance="{self.instance_name}" process="{self.process_name}" {parameters}\n')
 
 
 class ExecutionMode(Enum):
@@ -86,11 +95,17 @@ class ExecutionMode(Enum):
 
     @classmethod
     def _missing_(cls, value):
-        for member in cls:
-            if member.name.lower() == value.lower():
-                return member
-        # default
-        return cls.NORM
+        # non-string values are invalid. Enum raises ValueError
+        if not isinstance(value, str):
+            return None
+        # case-insensitive lookup by name. Default: NORM
+        return EXECUTION_MODES_BY_NAME.get(value.lower(), cls.NORM)
+
+
+EXECUTION_MODES_BY_NAME = {member.name.lower(): member for member in ExecutionMode}
+
+
+NESTED_TYPES = (list, tuple, set)
 
 
 def flatten_to_list(object) -> list:
@@ -102,13 +117,23 @@ def flatten_to_list(object) -> list:
     Returns:
         list: flat list of objects
     """
+    if isinstance(object, str):
+        return [object]
+
     gather = []
-    if not isinstance(object, str):
-        for item in object:
-            if isinstance(item, (list, tuple, set)):
-                gather.extend(flatten_to_list(item))
-            else:
-                gather.append(item)
-    else:
-        gather.append(object)
+    append, extend = gather.append, gather.extend
+    # iterators of the nested iterables being walked. No recursion, so deep nesting can't hit the recursion limit
+    stack = [iter(object)]
+    while stack:
+        for item in stack[-1]:
+            if isinstance(item, NESTED_TYPES):
+                # common case: iterable of plain items. Checked and copied at C speed
+                if not any(map(isinstance, item, repeat(NESTED_TYPES))):
+                    extend(item)
+                    continue
+                stack.append(iter(item))
+                break
+            append(item)
+        else:
+            stack.pop()
     return gather